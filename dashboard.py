@@ -1,8 +1,14 @@
+import functools
 import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
+import orjson
 import requests
-from flask import Flask, render_template_string, request
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask import Flask, request
 from zoneinfo import ZoneInfo
 
 # ---------------- CONFIG ----------------
@@ -29,6 +35,33 @@ BOOKMAKER_PRIORITY = [
     "wynnbet",
     "barstool",
 ]
+BOOKMAKER_RANK = {key: i for i, key in enumerate(BOOKMAKER_PRIORITY)}
+
+# NCAA gameState values (upper-cased) for games that have play-by-play worth fetching
+LIVE_GAME_STATES = ("LIVE", "HALFTIME", "IN")
+
+# Max concurrent play-by-play requests per refresh. Kept low because the public
+# NCAA API proxy rate-limits per IP.
+PBP_FETCH_WORKERS = 6
+
+# Retry policy for SESSION (urllib3 Retry). 429s honour Retry-After, capped so a
+# long server-requested wait can't stall a page load.
+HTTP_RETRIES = 2
+HTTP_BACKOFF = 0.2
+RETRY_STATUSES = (429, 502, 503, 504)
+RETRY_AFTER_MAX = 5
+
+# How long (seconds) to reuse scoreboard / odds responses between refreshes
+SCOREBOARD_TTL = 30
+ODDS_TTL = 120
+
+# Play-by-play cache TTLs: live 1H changes constantly; halftime PBP is held
+# longer only once two halftime fetches agree (the feed can lag the scoreboard)
+PBP_LIVE_TTL = 20
+PBP_HALFTIME_TTL = 600
+
+# Cleaned currentPeriod values that mean the game is at halftime (not "1ST HALF")
+HALFTIME_PERIODS = ("HALF", "HALFTIME")
 
 # Keywords that indicate a field-goal attempt (non-free-throw)
 SHOT_KEYWORDS = [
@@ -72,11 +105,97 @@ TURNOVER_IGNORE_PHRASES = [
     "points via turnovers",
 ]
 
+# One compiled alternation per keyword list, so each play is scanned once per list.
+# Patterns are lowercase and run against play text lowercased in bulk.
+_SHOT_RE = re.compile("|".join(map(re.escape, SHOT_KEYWORDS)))
+_TO_POS_RE = re.compile("|".join(map(re.escape, TURNOVER_POSITIVE_PHRASES)))
+_TO_IGN_RE = re.compile("|".join(map(re.escape, TURNOVER_IGNORE_PHRASES)))
+
+# Free-throw wording -> number of attempts (anything else is a single FTA).
+# Listed in precedence order: if a play mentions several, the earliest entry here wins.
+FT_COUNT_PHRASES = {
+    "both free throws": 2,
+    "all three free throws": 3,
+    "all 3 free throws": 3,
+    "three free throws": 3,
+    "3 free throws": 3,
+    "two free throws": 2,
+    "2 free throws": 2,
+}
+FT_PHRASE_RANK = {phrase: i for i, phrase in enumerate(FT_COUNT_PHRASES)}
+_FT_COUNT_RE = re.compile("|".join(map(re.escape, FT_COUNT_PHRASES)))
+
 app = Flask(__name__)
 
+class CappedRetry(Retry):
+    """urllib3 Retry that never sleeps longer than RETRY_AFTER_MAX for a Retry-After header."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_AFTER_MAX)
+
+
+# Shared HTTP session so repeated calls reuse keep-alive connections
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=32,
+    max_retries=CappedRetry(
+        total=HTTP_RETRIES,
+        backoff_factor=HTTP_BACKOFF,
+        status_forcelist=list(RETRY_STATUSES),
+    ),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+HTTP_HEADERS = {
+    "User-Agent": "ncaab-bet-helper-dashboard",
+    "Accept": "application/json",
+    # br is decoded transparently by urllib3 when the brotli package is installed
+    "Accept-Encoding": "gzip, br",
+}
+SESSION.headers.update(HTTP_HEADERS)
+
+
+# ---------------- CACHE HELPERS ----------------
+
+_cache = {}
+
+# (game_path, period_clean) -> (expiry, pbp_data)
+_PBP_CACHE: dict[tuple[str, str], tuple[float, dict]] = {}
+
+# game_path -> (plays fingerprint, 1H stats)
+_STATS_CACHE: dict[str, tuple[tuple, dict]] = {}
+
+
+def prune_game_caches(game_paths):
+    """Forget per-game stats for games no longer on today's scoreboard."""
+    for game_path in list(_STATS_CACHE):
+        if game_path not in game_paths:
+            _STATS_CACHE.pop(game_path, None)
+
+
+def ttl_cache(ttl):
+    """Cache a no-arg function's result for `ttl` seconds (errors are not cached)."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper():
+            now = time.monotonic()
+            hit = _cache.get(func.__name__)
+            if hit and hit[0] > now:
+                return hit[1]
+            value = func()
+            _cache[func.__name__] = (now + ttl, value)
+            return value
+        return wrapper
+    return decorator
+
 
 # ---------------- NCAA HELPERS ----------------
 
+@ttl_cache(SCOREBOARD_TTL)
 def get_ncaab_scoreboard_for_today():
     """Fetch today's NCAA D1 men's basketball scoreboard (try Eastern, fallback to system date)."""
     try:
@@ -87,9 +206,9 @@ def get_ncaab_scoreboard_for_today():
 
     year, month, day = d.year, d.month, d.day
     url = f"{NCAA_BASE_URL}/scoreboard/basketball-men/d1/{year}/{month:02d}/{day:02d}/all-conf"
-    resp = requests.get(url, timeout=10)
+    resp = SESSION.get(url, timeout=10)
     resp.raise_for_status()
-    return resp.json()
+    return orjson.loads(resp.content)
 
 
 def get_game_play_by_play(game_url_path):
@@ -97,17 +216,91 @@ def get_game_play_by_play(game_url_path):
         return None
     full_url = NCAA_BASE_URL + game_url_path + "/play-by-play"
     try:
-        resp = requests.get(full_url, timeout=10)
+        resp = SESSION.get(full_url, timeout=10)
         resp.raise_for_status()
     except Exception:
         return None
-    data = resp.json()
+    data = orjson.loads(resp.content)
     if not isinstance(data, dict):
         return None
     return data
 
 
-def compute_first_half_stats_from_pbp(pbp_data):
+def get_games_play_by_play(pbp_periods):
+    """
+    Fetch play-by-play for {game_path: period_clean} in parallel over SESSION.
+    Returns {game_path: pbp_data or None}; fresh _PBP_CACHE entries are reused.
+    """
+    results = {}
+    to_fetch = []
+    previous = {}  # game_path -> expired payload for the same period
+    now = time.monotonic()
+    for game_path, period_clean in pbp_periods.items():
+        hit = _PBP_CACHE.get((game_path, period_clean))
+        if hit and hit[0] > now:
+            results[game_path] = hit[1]
+        else:
+            to_fetch.append(game_path)
+            if hit:
+                previous[game_path] = hit[1]
+
+    if not to_fetch:
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(PBP_FETCH_WORKERS, len(to_fetch))) as pool:
+        fetched = list(pool.map(get_game_play_by_play, to_fetch))
+    now = time.monotonic()
+
+    # Drop expired payloads so finished games don't stay in memory
+    for key, (expiry, _) in list(_PBP_CACHE.items()):
+        if expiry <= now:
+            _PBP_CACHE.pop(key, None)
+
+    for game_path, data in zip(to_fetch, fetched):
+        results[game_path] = data
+        if data is None:
+            continue
+        period_clean = pbp_periods[game_path]
+        ttl = PBP_LIVE_TTL
+        if period_clean in HALFTIME_PERIODS and game_path in previous:
+            # Hold halftime PBP only once a second halftime fetch shows the same 1H plays
+            fingerprint = _pbp_fingerprint(data)
+            if fingerprint is not None and fingerprint == _pbp_fingerprint(previous[game_path]):
+                ttl = PBP_HALFTIME_TTL
+        _PBP_CACHE[(game_path, period_clean)] = (now + ttl, data)
+    return results
+
+
+def _first_half_plays(pbp_data):
+    """The 1st half's playbyplayStats list, or None if the payload has no 1st half."""
+    periods = pbp_data.get("periods", [])
+
+    # Find the 1st half period (periodNumber == 1, sent as either int or str)
+    first_half = next((p for p in periods if p.get("periodNumber") in (1, "1")), None)
+
+    if first_half is None:
+        return None
+    return first_half.get("playbyplayStats", [])
+
+
+def _plays_fingerprint(plays):
+    """Cheap identity for a plays list: its length plus the last play's text and score."""
+    if not plays:
+        return None
+    last_play = plays[-1]
+    return (
+        len(plays),
+        last_play.get("eventDescription", ""),
+        last_play.get("homeScore"),
+        last_play.get("visitorScore"),
+    )
+
+
+def _pbp_fingerprint(pbp_data):
+    return _plays_fingerprint(_first_half_plays(pbp_data))
+
+
+def compute_first_half_stats_from_pbp(pbp_data, game_path=None):
     """
     Simple version:
 
@@ -115,74 +308,83 @@ def compute_first_half_stats_from_pbp(pbp_data):
       - FTA: count based on free-throw wording
       - TO: any turnover line that looks like a real event
       - integer = FGA + (FTA / 2) + TO
+
+    If game_path is given, results are reused while the 1H plays are unchanged.
     """
-    periods = pbp_data.get("periods", [])
-    if not periods:
+    plays = _first_half_plays(pbp_data)
+    if plays is None:
         return None
 
-    # Find the 1st half period (periodNumber == 1)
-    first_half = None
-    for p in periods:
-        if str(p.get("periodNumber")) == "1":
-            first_half = p
-            break
+    # Skip the scan entirely if the plays haven't changed since last time
+    fingerprint = _plays_fingerprint(plays) if game_path else None
+    if fingerprint is not None:
+        cached = _STATS_CACHE.get(game_path)
+        if cached and cached[0] == fingerprint:
+            return cached[1]
 
-    if first_half is None:
-        return None
-
-    plays = first_half.get("playbyplayStats", [])
     fga = 0
     fta = 0
     turnovers = 0
     last_home_score = 0
     last_visitor_score = 0
 
+    descs = []
+    add_desc = descs.append
     for play in plays:
-        desc = play.get("eventDescription") or ""
-        if not desc:
-            desc = play.get("visitorText") or play.get("homeText") or ""
-        desc_lower = desc.lower()
+        get = play.get
+        add_desc(get("eventDescription") or get("visitorText") or get("homeText") or "")
 
         # Keep scores updated as we walk the plays
-        last_home_score = play.get("homeScore", last_home_score)
-        last_visitor_score = play.get("visitorScore", last_visitor_score)
-
+        home_score, visitor_score = get("homeScore"), get("visitorScore")
+        if home_score is not None:
+            last_home_score = home_score
+        if visitor_score is not None:
+            last_visitor_score = visitor_score
+
+    # Local names for the hot loop (LOAD_FAST instead of global lookups)
+    ft_count_findall = _FT_COUNT_RE.findall
+    shot_search = _SHOT_RE.search
+    to_ign_search = _TO_IGN_RE.search
+    to_pos_search = _TO_POS_RE.search
+
+    # Lowercase every 1H description in one call instead of once per play.
+    # Joined on NUL so a multi-line play stays one unit; if the feed ever sends
+    # a NUL inside a description, fall back to lowering each play on its own.
+    lowered = "\x00".join(descs).lower().split("\x00")
+    if len(lowered) != len(descs):
+        lowered = [desc.lower() for desc in descs]
+
+    for desc in lowered:
         # ---------- FREE THROWS (FTA) ----------
-        if "free throw" in desc_lower:
-            if "both free throws" in desc_lower:
-                fta += 2
-            elif "all three free throws" in desc_lower or "all 3 free throws" in desc_lower:
-                fta += 3
-            elif "three free throws" in desc_lower or "3 free throws" in desc_lower:
-                fta += 3
-            elif "two free throws" in desc_lower or "2 free throws" in desc_lower:
-                fta += 2
+        if "free throw" in desc:
+            ft_phrases = ft_count_findall(desc)
+            if ft_phrases:
+                fta += FT_COUNT_PHRASES[min(ft_phrases, key=FT_PHRASE_RANK.__getitem__)]
             else:
                 fta += 1
 
         # ---------- FIELD GOAL ATTEMPTS (non-FT FGA) ----------
-        has_shot_word = any(k in desc_lower for k in SHOT_KEYWORDS)
-        if has_shot_word and "free throw" not in desc_lower:
+        elif shot_search(desc):
             fga += 1
 
         # ---------- TURNOVERS ----------
-        if "turnover" in desc_lower:
+        if "turnover" in desc:
             # Ignore non-event commentary about turnovers
-            if any(bad in desc_lower for bad in TURNOVER_IGNORE_PHRASES):
+            if to_ign_search(desc):
                 continue
 
             # Count only if it looks like an actual event
-            positive_match = any(p in desc_lower for p in TURNOVER_POSITIVE_PHRASES)
+            positive_match = to_pos_search(desc)
 
             # Fallback: a line starting with "turnover" is almost always an event
-            starts_with_turnover = desc_lower.strip().startswith("turnover")
+            starts_with_turnover = desc.lstrip().startswith("turnover")
 
             if positive_match or starts_with_turnover:
                 turnovers += 1
 
     integer_value = fga + (fta / 2.0) + turnovers
 
-    return {
+    stats = {
         "fga": fga,
         "fta": fta,
         "turnovers": turnovers,
@@ -190,10 +392,18 @@ def compute_first_half_stats_from_pbp(pbp_data):
         "away_pts_1h": last_visitor_score,
         "integer": integer_value,
     }
+    if fingerprint is not None:
+        _STATS_CACHE[game_path] = (fingerprint, stats)
+    return stats
 
 
 # ---------------- ODDS API HELPERS ----------------
 
+_PUNCT_RE = re.compile(r"[^a-z0-9\s]")
+_NOISE_RE = re.compile(r"\b(?:university|college|state|st|the|of)\b")
+_WS_RE = re.compile(r"\s+")
+
+
 def normalize_team_name(name: str) -> str:
     """Normalize team names so NCAA vs Odds API names match more often."""
     if not name:
@@ -201,19 +411,25 @@ def normalize_team_name(name: str) -> str:
     s = name.lower()
     s = s.replace("&", "and")
     # Remove punctuation
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
+    s = _PUNCT_RE.sub(" ", s)
     # Drop common noise words
-    for word in ["university", "college", "state", "st", "st.", "the", "of"]:
-        s = re.sub(rf"\b{word}\b", " ", s)
+    s = _NOISE_RE.sub(" ", s)
     # Collapse spaces
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _WS_RE.sub(" ", s).strip()
     return s
 
 
+@functools.lru_cache(maxsize=2048)
+def _team_name_tokens(name):
+    """(normalized name, frozenset of its tokens), cached per raw name."""
+    norm = normalize_team_name(name)
+    return norm, frozenset(norm.split())
+
+
 def teams_match_name(ncaa_name, odds_name):
     """Looser match: normalize, then check substring or ≥2 common tokens."""
-    a = normalize_team_name(ncaa_name)
-    b = normalize_team_name(odds_name)
+    a, tokens_a = _team_name_tokens(ncaa_name)
+    b, tokens_b = _team_name_tokens(odds_name)
     if not a or not b:
         return False
 
@@ -222,12 +438,10 @@ def teams_match_name(ncaa_name, odds_name):
         return True
 
     # Token overlap
-    set_a = set(a.split())
-    set_b = set(b.split())
-    common = set_a & set_b
-    return len(common) >= 2
+    return len(tokens_a & tokens_b) >= 2
 
 
+@ttl_cache(ODDS_TTL)
 def fetch_odds_games_today():
     """
     Fetch Odds API full-game totals for NCAAB and keep only events
@@ -243,9 +457,9 @@ def fetch_odds_games_today():
         "oddsFormat": "decimal",
         "dateFormat": "iso",
     }
-    resp = requests.get(url, params=params, timeout=10)
+    resp = SESSION.get(url, params=params, timeout=10)
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content)
     if not isinstance(data, list):
         return []
 
@@ -265,6 +479,14 @@ def fetch_odds_games_today():
     return filtered
 
 
+def _any_name_matches(ncaa_names, odds_name):
+    """True if any non-empty NCAA name variant matches the Odds API name."""
+    for n in ncaa_names:
+        if n and teams_match_name(n, odds_name):
+            return True
+    return False
+
+
 def find_matching_odds_event(odds_games, ncaa_home_names, ncaa_away_names):
     """
     Try to match by:
@@ -277,42 +499,73 @@ def find_matching_odds_event(odds_games, ncaa_home_names, ncaa_away_names):
         odds_away = event.get("away_team", "")
 
         # Normal alignment
-        home_ok = any(teams_match_name(n, odds_home) for n in ncaa_home_names if n)
-        away_ok = any(teams_match_name(n, odds_away) for n in ncaa_away_names if n)
-
-        if home_ok and away_ok:
+        if (_any_name_matches(ncaa_home_names, odds_home)
+                and _any_name_matches(ncaa_away_names, odds_away)):
             return event
 
         # Swapped alignment
-        home_ok_swapped = any(teams_match_name(n, odds_away) for n in ncaa_home_names if n)
-        away_ok_swapped = any(teams_match_name(n, odds_home) for n in ncaa_away_names if n)
-
-        if home_ok_swapped and away_ok_swapped:
+        if (_any_name_matches(ncaa_home_names, odds_away)
+                and _any_name_matches(ncaa_away_names, odds_home)):
             return event
 
     return None
 
 
+def _odds_index_key(home_name, away_name):
+    """Order-independent key: the normalized tokens of both team names."""
+    home_norm, home_tokens = _team_name_tokens(home_name)
+    away_norm, away_tokens = _team_name_tokens(away_name)
+    if not home_norm or not away_norm:
+        return None
+    return home_tokens | away_tokens
+
+
+def build_odds_index(odds_games):
+    """Index odds events by team-name tokens so most games match with one dict lookup."""
+    odds_index = {}
+    for event in odds_games:
+        key = _odds_index_key(event.get("home_team", ""), event.get("away_team", ""))
+        if key:
+            odds_index.setdefault(key, event)
+    return odds_index
+
+
+def lookup_odds_event(odds_index, odds_games, ncaa_home_names, ncaa_away_names):
+    """
+    Exact token lookup against build_odds_index() for every home/away name pair,
+    falling back to the fuzzy find_matching_odds_event() scan on a miss.
+    """
+    for home_name in ncaa_home_names:
+        if not home_name:
+            continue
+        for away_name in ncaa_away_names:
+            if not away_name:
+                continue
+            event = odds_index.get(_odds_index_key(home_name, away_name))
+            if event:
+                return event
+
+    return find_matching_odds_event(odds_games, ncaa_home_names, ncaa_away_names)
+
+
 def extract_full_game_total_with_book(event):
     """
     Look through bookmakers in priority order
     and return (total_points, bookmaker_name) for the first one found.
     """
-    bookmakers = event.get("bookmakers", [])
-    bm_by_key = {bm.get("key"): bm for bm in bookmakers}
+    bookmakers = sorted(
+        (bm for bm in event.get("bookmakers", []) if bm.get("key") in BOOKMAKER_RANK),
+        key=lambda bm: BOOKMAKER_RANK[bm["key"]],
+    )
 
-    for key in BOOKMAKER_PRIORITY:
-        bm = bm_by_key.get(key)
-        if not bm:
+    for bm in bookmakers:
+        # We only request ODDS_MARKETS = "totals", so it is the one market returned
+        try:
+            point = bm["markets"][0]["outcomes"][0]["point"]
+        except (KeyError, IndexError, TypeError):
             continue
-        for market in bm.get("markets", []):
-            if market.get("key") == "totals":
-                outcomes = market.get("outcomes", [])
-                if not outcomes:
-                    continue
-                point = outcomes[0].get("point")
-                if point is not None:
-                    return float(point), bm.get("title") or key
+        if point is not None:
+            return float(point), bm.get("title") or bm["key"]
     return None, None
 
 
@@ -347,6 +600,22 @@ def evaluate_bet(integer_value, home_pts_1h, away_pts_1h, derived_2h_line):
 
 # ---------------- DASHBOARD CORE ----------------
 
+def _first_half_period(g):
+    """
+    (period, period_clean) for games in the 1st half or at halftime, else None.
+    period is the upper-cased feed value shown on the dashboard.
+    """
+    period = (g.get("currentPeriod") or "").upper()
+    period_clean = period.replace(".", "").strip()
+    if "HALF" in period_clean or (
+        "1" in period_clean and
+        "FINAL" not in period_clean and
+        "OT" not in period_clean
+    ):
+        return period, period_clean
+    return None
+
+
 def build_dashboard_rows():
     rows = []
 
@@ -363,9 +632,33 @@ def build_dashboard_rows():
     except Exception as e:
         return [], f"Error loading Odds API data: {e}"
 
+    odds_index = build_odds_index(odds_games)
+    prune_game_caches({gwrap.get("game", {}).get("url") for gwrap in games})
+
+    # ---------- FILTER: ONLY SHOW 1ST HALF OR HALFTIME ----------
+    live_games = []
+    pbp_periods = {}  # game_path -> period_clean
     for gwrap in games:
         g = gwrap.get("game", {})
+        first_half_period = _first_half_period(g)
+        if first_half_period is None:
+            continue
+
+        period, period_clean = first_half_period
+        state = (g.get("gameState") or "").upper()
+        game_path = g.get("url")
 
+        live_games.append((g, state, period))
+
+        # Only fetch PBP for games actually in progress; halftime games are
+        # served from the PBP cache for PBP_HALFTIME_TTL
+        if game_path and state in LIVE_GAME_STATES and g.get("hasPbp", True):
+            pbp_periods[game_path] = period_clean
+
+    # Fetch play-by-play for all remaining games concurrently
+    pbp_by_path = get_games_play_by_play(pbp_periods) if pbp_periods else {}
+
+    for g, state, period in live_games:
         away = g.get("away", {})
         home = g.get("home", {})
 
@@ -382,24 +675,6 @@ def build_dashboard_rows():
         home_char6 = home_names.get("char6")
         home_seo = home_names.get("seo")
 
-        state = (g.get("gameState") or "").upper()
-        period = (g.get("currentPeriod") or "").upper()
-        game_path = g.get("url")
-
-        # ---------- FILTER: ONLY SHOW 1ST HALF OR HALFTIME ----------
-        period_clean = period.replace(".", "").strip()
-
-        is_first_half = (
-            "1" in period_clean and
-            "FINAL" not in period_clean and
-            "OT" not in period_clean and
-            "HALF" not in period_clean
-        )
-        is_halftime = "HALF" in period_clean
-
-        if not (is_first_half or is_halftime):
-            continue
-
         stats_1h = None
         full_game_total = None
         full_game_book = None
@@ -407,13 +682,14 @@ def build_dashboard_rows():
         eval_result = None
 
         # 1H stats from NCAA if PBP exists
-        if g.get("hasPbp", True):
-            pbp = get_game_play_by_play(game_path)
-            if pbp:
-                stats_1h = compute_first_half_stats_from_pbp(pbp)
+        game_path = g.get("url")
+        pbp = pbp_by_path.get(game_path)
+        if pbp:
+            stats_1h = compute_first_half_stats_from_pbp(pbp, game_path)
 
         # Match to Odds API game using more name variants
-        odds_event = find_matching_odds_event(
+        odds_event = lookup_odds_event(
+            odds_index,
             odds_games,
             [home_short, home_full, home_char6, home_seo],
             [away_short, away_full, away_char6, away_seo],
@@ -596,12 +872,16 @@ TEMPLATE = """
 </html>
 """
 
+# Parse/compile once at import; Flask's environment keeps HTML autoescaping on
+_TEMPLATE = app.jinja_env.from_string(TEMPLATE)
+
 
 @app.route("/test-odds")
 def test_odds():
     """Simple check page for The Odds API."""
     try:
-        games = fetch_odds_games_today()
+        # Bypass the TTL cache so this reflects the API right now
+        games = fetch_odds_games_today.__wrapped__()
         return f"OK - got {len(games)} events from The Odds API.", 200
     except Exception as e:
         return f"ERROR talking to The Odds API: {e}", 500
@@ -611,7 +891,8 @@ def test_odds():
 def test_ncaa():
     """Simple check page for the NCAA scoreboard."""
     try:
-        scoreboard = get_ncaab_scoreboard_for_today()
+        # Bypass the TTL cache so this reflects the API right now
+        scoreboard = get_ncaab_scoreboard_for_today.__wrapped__()
         games = scoreboard.get("games", [])
         return f"OK - got {len(games)} games from the NCAA API.", 200
     except Exception as e:
@@ -649,8 +930,7 @@ def list_games():
 @app.route("/", methods=["GET", "POST"])
 def index():
     rows, error = build_dashboard_rows()
-    return render_template_string(
-        TEMPLATE,
+    return _TEMPLATE.render(
         rows=rows,
         error=error,
         today=date.today().isoformat()